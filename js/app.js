@@ -39,7 +39,20 @@ export class RouteCrafterApp {
         // Coordinate mappings for largest component (when exported)
         this.largestComponentCoordinateToNodeIdMap = new Map();
         this.largestComponentNodeIdToCoordinateMap = new Map();
-        
+
+        // Cache of the last largest-component export so repeated "Generate Route"
+        // clicks with unchanged roads/settings skip the full graph rebuild
+        this.roadFetchGeneration = 0;
+        this.cachedExportKey = null;
+        this.cachedExportResult = null;
+
+        // Long-lived Web Worker hosting the TeaVM solver (created on demand)
+        this.solverWorker = null;
+        this.solverWorkerFailed = false;
+        this.solverJobId = 0;
+        // jobId -> resolve for solver jobs awaiting a worker reply
+        this.pendingSolverJobs = new Map();
+
         this.init();
     }
 
@@ -112,6 +125,10 @@ export class RouteCrafterApp {
 
         // Keep app identity in the map attribution only when the sidebar becomes mobile floating controls.
         this.setupResponsiveAttribution();
+
+        // Spawn the solver worker now so the first route generation doesn't
+        // pay the worker startup and TeaVM runtime parse cost
+        this.getSolverWorker();
     }
 
     setupResponsiveAttribution() {
@@ -821,6 +838,11 @@ export class RouteCrafterApp {
         this.largestComponentCoordinateToNodeIdMap.clear();
         this.largestComponentNodeIdToCoordinateMap.clear();
 
+        // New road data invalidates any cached export
+        this.roadFetchGeneration++;
+        this.cachedExportKey = null;
+        this.cachedExportResult = null;
+
         this.graphBuilder.createCoordinateMappings(
             roadFeatures,
             this.coordinateToNodeIdMap,
@@ -885,8 +907,10 @@ export class RouteCrafterApp {
             return;
         }
         
-        // Download the raw Overpass response as a JSON file
-        const blob = new Blob([JSON.stringify(window.overpassResponse, null, 2)], {
+        // Download the raw Overpass response as a JSON file. Compact output —
+        // pretty-printing a multi-MB response roughly doubles the serialization
+        // work and the file size for no benefit in a debug download.
+        const blob = new Blob([JSON.stringify(window.overpassResponse)], {
             type: 'application/json'
         });
         const url = URL.createObjectURL(blob);
@@ -932,13 +956,33 @@ export class RouteCrafterApp {
     button.classList.add('button-loading');
     button.innerHTML = 'Generating Route <span class="spinner"></span>';
 
+        // Let the browser paint the loading state before the synchronous
+        // export + solver work blocks the main thread
+        await new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+
         try {
-            const exportResult = this.graphBuilder.exportLargestComponentForChinesePostman(
-                geoJsonLayer,
-                this.coordinateToNodeIdMap,
-                this.nodeIdToCoordinateMap,
-                { download: false, silent: true }
-            );
+            // Reuse the previous export when nothing affecting it has changed;
+            // rebuilding the graph is the most expensive part of the setup.
+            const coverageFilterEnabled = document.getElementById('filterMapillaryCoverage').checked;
+            const exportCacheKey = [
+                this.roadFetchGeneration,
+                this.getTeaVMSolverId(),
+                coverageFilterEnabled,
+                selectedDepot
+            ].join('|');
+
+            let exportResult;
+            if (this.cachedExportResult && this.cachedExportKey === exportCacheKey) {
+                console.log('Reusing cached largest component export (roads and settings unchanged)');
+                exportResult = this.cachedExportResult;
+            } else {
+                exportResult = this.graphBuilder.exportLargestComponentForChinesePostman(
+                    geoJsonLayer,
+                    this.coordinateToNodeIdMap,
+                    this.nodeIdToCoordinateMap,
+                    { download: false, silent: true }
+                );
+            }
 
             if (!exportResult) {
                 return;
@@ -949,6 +993,9 @@ export class RouteCrafterApp {
                 return;
             }
 
+            this.cachedExportKey = exportCacheKey;
+            this.cachedExportResult = exportResult;
+
             this.largestComponentCoordinateToNodeIdMap = exportResult.coordinateToNodeIdMap;
             this.largestComponentNodeIdToCoordinateMap = exportResult.nodeIdToCoordinateMap;
             this.refreshVertexMarkers();
@@ -977,10 +1024,23 @@ export class RouteCrafterApp {
                 console.warn('Failed to remap selected depot after export for TeaVM:', err);
             }
 
-            const teaVMResult = await this.runTeaVMAndCaptureOutput(solverId, exportResult.oarlibContent);
+            // Prefer the persistent solver worker; fall back to the
+            // main-thread runtime if the worker is unavailable or dies
+            let teaVMResult = null;
+            const solverWorker = this.getSolverWorker();
+            if (solverWorker) {
+                teaVMResult = await this.runTeaVMInWorker(solverWorker, solverId, exportResult.oarlibContent);
+            }
+            if (!teaVMResult) {
+                teaVMResult = await this.runTeaVMAndCaptureOutput(solverId, exportResult.oarlibContent);
+            }
 
-            const combinedError = this.buildTeaVMErrorMessage(teaVMResult);
-            if (!teaVMResult || !teaVMResult.success || combinedError) {
+            // The solver's success flag is the failure signal; stderr output is
+            // only detail text. Solvers log progress and warnings to stderr on
+            // perfectly good runs, so treating any stderr line as fatal
+            // discards valid solutions.
+            if (!teaVMResult || !teaVMResult.success) {
+                const combinedError = this.buildTeaVMErrorMessage(teaVMResult);
                 if (combinedError) {
                     alert(`TeaVM solver failed:\n${combinedError}`);
                 } else {
@@ -1039,6 +1099,74 @@ export class RouteCrafterApp {
         }
     }
 
+    getSolverWorker() {
+        if (this.solverWorker || this.solverWorkerFailed) {
+            return this.solverWorker;
+        }
+
+        if (typeof Worker !== 'function') {
+            this.solverWorkerFailed = true;
+            return null;
+        }
+
+        try {
+            const worker = new Worker('js/solver-worker.js');
+
+            worker.addEventListener('message', (event) => {
+                const data = event.data;
+                if (!data || !this.pendingSolverJobs.has(data.jobId)) {
+                    return;
+                }
+                const resolve = this.pendingSolverJobs.get(data.jobId);
+                this.pendingSolverJobs.delete(data.jobId);
+                resolve({
+                    outputLines: data.outputLines || [],
+                    errorLines: data.errorLines || [],
+                    success: data.success === true,
+                    error: data.errorMessage ? new Error(data.errorMessage) : null
+                });
+            });
+
+            // Persistent error handler: worker scripts load asynchronously, so
+            // a failed importScripts can fire this while no job is in flight
+            // (e.g. during the startup pre-warm). Attaching it here — not per
+            // job — ensures the worker is marked dead immediately instead of
+            // silently swallowing the next posted job.
+            worker.addEventListener('error', (event) => {
+                console.warn('Solver worker failed, falling back to main-thread solver:', event.message || event);
+                worker.terminate();
+                this.solverWorker = null;
+                this.solverWorkerFailed = true;
+                const pendingResolvers = Array.from(this.pendingSolverJobs.values());
+                this.pendingSolverJobs.clear();
+                pendingResolvers.forEach(resolve => resolve(null));
+            });
+
+            this.solverWorker = worker;
+        } catch (error) {
+            console.warn('Unable to create solver worker, falling back to main-thread solver:', error);
+            this.solverWorker = null;
+            this.solverWorkerFailed = true;
+        }
+
+        return this.solverWorker;
+    }
+
+    runTeaVMInWorker(worker, solverId, instanceContent) {
+        return new Promise((resolve) => {
+            // The worker may have died since the caller grabbed its reference;
+            // resolve null so handleGenerateRoute takes the main-thread path
+            if (this.solverWorkerFailed || worker !== this.solverWorker) {
+                resolve(null);
+                return;
+            }
+
+            const jobId = ++this.solverJobId;
+            this.pendingSolverJobs.set(jobId, resolve);
+            worker.postMessage({ jobId, solverId: String(solverId), instanceContent });
+        });
+    }
+
     async runTeaVMAndCaptureOutput(solverId, instanceContent) {
         const outputLines = [];
         const errorLines = [];
@@ -1246,9 +1374,20 @@ export class RouteCrafterApp {
             this.largestComponentNodeIdToCoordinateMap.clear();
             this.refreshVertexMarkers();
 
+            // Drop any cached export now that the roads are gone
+            this.cachedExportKey = null;
+            this.cachedExportResult = null;
+
             // Clear largest component global variables
             try { window.largestComponentRequiredRoadLengthKm = null; } catch (e) { /* ignore */ }
 
+            // Release the raw Overpass response and road-length globals; the
+            // response alone can hold many megabytes of element data
+            try { window.overpassResponse = null; } catch (e) { /* ignore */ }
+            try { window.overpassQuery = null; } catch (e) { /* ignore */ }
+            try { window.totalRoadLengthKm = null; } catch (e) { /* ignore */ }
+            try { window.requiredRoadLengthKm = null; } catch (e) { /* ignore */ }
+
             // Reset routing manager
             this.routingManager.stopAnimation();
             this.routingManager.setRoutePoints([]);
@@ -1349,16 +1488,19 @@ export class RouteCrafterApp {
             const header = `<?xml version="1.0" encoding="UTF-8"?>\n<gpx version="1.1" creator="Route Crafter" xmlns="http://www.topografix.com/GPX/1/1">\n  <trk>\n    <name>${filename}</name>\n    <trkseg>\n`;
             const footer = '    </trkseg>\n  </trk>\n</gpx>';
 
-            // Each point is [lat, lng]
-            const pts = routePoints.map(p => {
-                const lat = p[0];
-                const lon = p[1];
-                return `      <trkpt lat="${lat}" lon="${lon}"></trkpt>`;
-            }).join('\n');
-
-            const gpx = header + pts + '\n' + footer;
+            // Each point is [lat, lng]. Collect the chunks and hand them to the
+            // Blob directly — no need to concatenate the whole document into one
+            // giant string first. Coordinates are written with 6 decimal places
+            // (~0.1m), which keeps multi-thousand-point files far smaller than
+            // serializing the full float precision.
+            const parts = [header];
+            for (let i = 0; i < routePoints.length; i++) {
+                const p = routePoints[i];
+                parts.push(`      <trkpt lat="${p[0].toFixed(6)}" lon="${p[1].toFixed(6)}"></trkpt>\n`);
+            }
+            parts.push(footer);
 
-            const blob = new Blob([gpx], { type: 'application/gpx+xml' });
+            const blob = new Blob(parts, { type: 'application/gpx+xml' });
             const url = URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
@@ -2,6 +2,9 @@
 
 import { matchesMapillaryFilterCriteria, matchesPanoramaxFilterCriteria, matchesMapilioFilterCriteria } from './utils.js';
 
+// Maximum number of coverage tile requests in flight per source
+const TILE_FETCH_CONCURRENCY = 8;
+
 export class CoverageManager {
     constructor(map, baseMaps) {
         this.map = map;
@@ -546,13 +549,9 @@ export class CoverageManager {
         
         console.log(`Fetching Mapillary coverage for ${tiles.length} tiles at zoom ${zoom}`);
         
-        // Fetch all tiles
-        const tilePromises = tiles.map(tile => 
-            this.fetchMapillaryTile(tile.x, tile.y, tile.z)
-        );
-        
         try {
-            const tileResults = await Promise.all(tilePromises);
+            // Fetch all tiles with bounded concurrency
+            const tileResults = await this.fetchTilesWithLimit(tiles, (x, y, z) => this.fetchMapillaryTile(x, y, z));
             
             // Combine all sequences from all tiles
             const allSequences = [];
@@ -578,6 +577,31 @@ export class CoverageManager {
         }
     }
 
+    // Fetch all tiles with at most TILE_FETCH_CONCURRENCY requests in flight.
+    // Firing every tile request at once floods the tile servers on large areas
+    // and invites rate limiting; a small worker pool keeps throughput without
+    // the burst. Results are returned in tile order.
+    async fetchTilesWithLimit(tiles, fetchTile) {
+        const results = new Array(tiles.length);
+        let nextIndex = 0;
+
+        const worker = async () => {
+            while (nextIndex < tiles.length) {
+                const index = nextIndex++;
+                const tile = tiles[index];
+                results[index] = await fetchTile(tile.x, tile.y, tile.z);
+            }
+        };
+
+        const workers = [];
+        for (let i = 0; i < Math.min(TILE_FETCH_CONCURRENCY, tiles.length); i++) {
+            workers.push(worker());
+        }
+        await Promise.all(workers);
+
+        return results;
+    }
+
     // Calculate which tiles are needed for a bounding box at a given zoom level
     getTilesForBounds(bbox, zoom) {
         const tiles = [];
@@ -678,13 +702,9 @@ export class CoverageManager {
         
         console.log(`Fetching Panoramax coverage for ${tiles.length} tiles at zoom ${zoom}`);
         
-        // Fetch all tiles
-        const tilePromises = tiles.map(tile => 
-            this.fetchPanoramaxTile(tile.x, tile.y, tile.z)
-        );
-        
         try {
-            const tileResults = await Promise.all(tilePromises);
+            // Fetch all tiles with bounded concurrency
+            const tileResults = await this.fetchTilesWithLimit(tiles, (x, y, z) => this.fetchPanoramaxTile(x, y, z));
             
             // Combine all sequences from all tiles
             const allSequences = [];
@@ -774,13 +794,9 @@ export class CoverageManager {
         
         console.log(`Fetching Mapilio coverage for ${tiles.length} tiles at zoom ${zoom}`);
         
-        // Fetch all tiles
-        const tilePromises = tiles.map(tile => 
-            this.fetchMapilioTile(tile.x, tile.y, tile.z)
-        );
-        
         try {
-            const tileResults = await Promise.all(tilePromises);
+            // Fetch all tiles with bounded concurrency
+            const tileResults = await this.fetchTilesWithLimit(tiles, (x, y, z) => this.fetchMapilioTile(x, y, z));
             
             // Combine all sequences from all tiles
             const allSequences = [];
@@ -1,6 +1,6 @@
 // Graph building module for OARLib format export
 
-import { findStronglyConnectedComponents, filterGraphByComponent } from './utils.js';
+import { findStronglyConnectedComponents, filterGraphByComponent, calculateDistance } from './utils.js';
 
 export class GraphBuilder {
     constructor() {
@@ -478,10 +478,13 @@ Line Format: x,y
                 const sourceNodeId = getNodeId(sourceCoord);
                 const targetNodeId = getNodeId(targetCoord);
                 
-                // Calculate distance between coordinates (weight for CPP)
-                const sourcePoint = turf.point(sourceCoord);
-                const targetPoint = turf.point(targetCoord);
-                const distance = turf.distance(sourcePoint, targetPoint, { units: 'meters' });
+                // Calculate distance between coordinates (weight for CPP).
+                // Plain haversine on the raw coordinates — wrapping every
+                // segment in turf point features just allocates garbage
+                const distance = calculateDistance(
+                    [sourceCoord[1], sourceCoord[0]],
+                    [targetCoord[1], targetCoord[0]]
+                ) * 1000; // km -> meters
                 
                 // Skip zero-length edges
                 if (distance === 0) continue;
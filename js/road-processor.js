@@ -1,14 +1,21 @@
 // Road fetching and processing module
 
-import { getSelectedOverpassEndpoint, reportInvalidOverpassEndpoint, stopSpinner } from './utils.js';
+import { getSelectedOverpassEndpoint, reportInvalidOverpassEndpoint, stopSpinner, calculateDistance } from './utils.js';
+
+// Maximum number of Overpass responses kept in the in-memory cache
+const OVERPASS_CACHE_LIMIT = 8;
 
 export class RoadProcessor {
     constructor(mapManager, areaManager, coverageManager) {
         this.mapManager = mapManager;
         this.areaManager = areaManager;
         this.coverageManager = coverageManager;
-        
+
         this.geoJsonLayer = null;
+
+        // LRU cache of raw Overpass responses keyed by endpoint + query
+        // (most recently used entry last)
+        this.overpassCache = new Map();
     }
 
     getGeoJsonLayer() {
@@ -19,75 +26,80 @@ export class RoadProcessor {
         this.geoJsonLayer = layer;
     }
 
-    // Helper function to check if a feature matches an Overpass filter
-    checkFeatureMatchesFilter(feature, filterString) {
+    // Compile an Overpass filter string into a feature predicate. Parsing is
+    // done once here so call sites can evaluate thousands of features without
+    // re-splitting the filter per feature.
+    compileFilterMatcher(filterString) {
         if (!filterString || filterString.trim() === '') {
-            return true; // Empty filter matches everything
+            return () => true; // Empty filter matches everything
         }
-        
+
         // Split by OR to support union logic
         // Handle " OR ", " or ", " || " as delimiters
-        const filterGroups = filterString.split(/\s+(?:OR|or|\|\|)\s+/);
-        
-        // If any group matches, the feature matches (OR logic)
-        return filterGroups.some(group => this.checkFeatureMatchesFilterGroup(feature, group));
-    }
-
-    // Helper to check a single AND group of conditions
-    checkFeatureMatchesFilterGroup(feature, filterString) {
-        const props = feature.properties || {};
-        
-        // Parse the Overpass filter string
+        // Each group becomes a list of parsed AND conditions
         // Format: [key=value][key!=value][key!~"regex"]
-        const filterRegex = /\[([^\]]+)\]/g;
-        let match;
-        
-        while ((match = filterRegex.exec(filterString)) !== null) {
-            const condition = match[1];
-            
-            // Handle different condition types
-            if (condition.includes('!~')) {
-                // Negative regex match: key!~"value1|value2"
-                const parts = condition.split('!~');
-                const key = parts[0].trim();
-                const valuePattern = parts[1].replace(/["']/g, '').trim();
-                const values = valuePattern.split('|');
-                
-                const propValue = props[key];
-                if (propValue && values.includes(String(propValue))) {
-                    return false; // Property matches excluded pattern
-                }
-            } else if (condition.includes('!=')) {
-                // Not equal: key!=value
-                const parts = condition.split('!=');
-                const key = parts[0].trim();
-                const value = parts[1].replace(/["']/g, '').trim();
-                
-                const propValue = props[key];
-                if (propValue && String(propValue) === value) {
-                    return false; // Property equals excluded value
-                }
-            } else if (condition.includes('=')) {
-                // Equal: key=value
-                const parts = condition.split('=');
-                const key = parts[0].trim();
-                const value = parts[1].replace(/["']/g, '').trim();
-                const values = value.split('|');
-                
-                const propValue = props[key];
-                if (!propValue || !values.includes(String(propValue))) {
-                    return false; // Property doesn't match required value
-                }
-            } else {
-                // Just key existence: [key]
-                const key = condition.trim();
-                if (!props[key]) {
-                    return false; // Property doesn't exist
+        const filterGroups = filterString.split(/\s+(?:OR|or|\|\|)\s+/).map(group => {
+            const conditions = [];
+            const filterRegex = /\[([^\]]+)\]/g;
+            let match;
+
+            while ((match = filterRegex.exec(group)) !== null) {
+                const condition = match[1];
+
+                if (condition.includes('!~')) {
+                    // Negative regex match: key!~"value1|value2"
+                    const parts = condition.split('!~');
+                    conditions.push({
+                        type: 'notMatches',
+                        key: parts[0].trim(),
+                        values: new Set(parts[1].replace(/["']/g, '').trim().split('|'))
+                    });
+                } else if (condition.includes('!=')) {
+                    // Not equal: key!=value
+                    const parts = condition.split('!=');
+                    conditions.push({
+                        type: 'notEquals',
+                        key: parts[0].trim(),
+                        value: parts[1].replace(/["']/g, '').trim()
+                    });
+                } else if (condition.includes('=')) {
+                    // Equal: key=value
+                    const parts = condition.split('=');
+                    conditions.push({
+                        type: 'equals',
+                        key: parts[0].trim(),
+                        values: new Set(parts[1].replace(/["']/g, '').trim().split('|'))
+                    });
+                } else {
+                    // Just key existence: [key]
+                    conditions.push({ type: 'exists', key: condition.trim() });
                 }
             }
-        }
-        
-        return true; // All conditions passed
+            return conditions;
+        });
+
+        // If any group matches, the feature matches (OR logic)
+        return (feature) => {
+            const props = feature.properties || {};
+            return filterGroups.some(conditions => conditions.every(cond => {
+                const propValue = props[cond.key];
+                switch (cond.type) {
+                    case 'notMatches':
+                        return !(propValue && cond.values.has(String(propValue)));
+                    case 'notEquals':
+                        return !(propValue && String(propValue) === cond.value);
+                    case 'equals':
+                        return Boolean(propValue) && cond.values.has(String(propValue));
+                    default: // 'exists'
+                        return Boolean(propValue);
+                }
+            }));
+        };
+    }
+
+    // Helper function to check if a feature matches an Overpass filter
+    checkFeatureMatchesFilter(feature, filterString) {
+        return this.compileFilterMatcher(filterString)(feature);
     }
 
     // Helper function to convert polygon coordinates to Overpass poly format
@@ -373,8 +385,69 @@ export class RoadProcessor {
         return result;
     }
 
+    // Fetch an Overpass query result, serving repeats of the same query from
+    // a small in-memory LRU cache so re-fetching an unchanged area skips the
+    // network round trip entirely
+    fetchOverpassData(overpassEndpoint, minifiedQuery) {
+        const cacheKey = `${overpassEndpoint}|${minifiedQuery}`;
+
+        if (this.overpassCache.has(cacheKey)) {
+            const cached = this.overpassCache.get(cacheKey);
+            // Re-insert to mark this entry as most recently used
+            this.overpassCache.delete(cacheKey);
+            this.overpassCache.set(cacheKey, cached);
+            console.log('Using cached Overpass response for this query');
+            return Promise.resolve(cached);
+        }
+
+        return fetch(overpassEndpoint, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8'
+            },
+            body: 'data=' + encodeURIComponent(minifiedQuery)
+        }).then(response => {
+            if (!response.ok) {
+                let errorMessage = '';
+                switch (response.status) {
+                    case 504:
+                        errorMessage = 'Gateway Timeout (504): The server took too long to respond. Please try again.';
+                        break;
+                    case 502:
+                        errorMessage = 'Bad Gateway (502): The server is temporarily unavailable. Please try again later.';
+                        break;
+                    case 503:
+                        errorMessage = 'Service Unavailable (503): The server is temporarily overloaded. Please try again later.';
+                        break;
+                    case 429:
+                        errorMessage = 'Too Many Requests (429): Rate limit exceeded. Please wait a moment before trying again.';
+                        break;
+                    case 400:
+                        errorMessage = 'Bad Request (400): Invalid query parameters. Please try a different search.';
+                        break;
+                    default:
+                        errorMessage = `Server Error (${response.status}): ${response.statusText}. Please try again.`;
+                }
+                throw new Error(errorMessage);
+            }
+            return response.json();
+        }).then(data => {
+            // Don't cache timed-out/partial responses
+            if (!data.remark || !data.remark.includes('Query timed out')) {
+                this.overpassCache.set(cacheKey, data);
+                while (this.overpassCache.size > OVERPASS_CACHE_LIMIT) {
+                    this.overpassCache.delete(this.overpassCache.keys().next().value);
+                }
+            }
+            return data;
+        });
+    }
+
     fetchRoadsInArea(createCoordinateMappingsCallback) {
         const previewGPXButton = document.getElementById('previewGPXButton');
+        // Disable the button while a fetch is in flight so a double click
+        // cannot start two identical Overpass requests
+        previewGPXButton.disabled = true;
         previewGPXButton.classList.add('button-loading');
         previewGPXButton.innerHTML = 'Fetching Roads <span class="spinner"></span>';
 
@@ -448,40 +521,30 @@ export class RoadProcessor {
                         });
                     }
 
-                    // Convert each component to a FeatureCollection of its outer-ring vertices
-                    const pointCollections = components.map(poly => {
-                        const coords = (poly.geometry.coordinates && poly.geometry.coordinates[0]) || [];
-                        const pts = coords.map(c => turf.point(c));
-                        return turf.featureCollection(pts);
+                    // Outer-ring vertices of each component as raw [lon, lat] arrays
+                    const componentRings = components.map(poly => {
+                        return (poly.geometry.coordinates && poly.geometry.coordinates[0]) || [];
                     });
 
-                    const n = pointCollections.length;
+                    const n = componentRings.length;
                     if (n > 1) {
-                        // Compute pairwise minimal gap distances (meters) between components
+                        // Compute pairwise minimal gap distances (meters) between
+                        // components with a direct haversine double loop. The gap
+                        // is symmetric, so one pass per pair suffices — the old
+                        // turf.nearestPoint-per-vertex approach scanned every pair
+                        // of vertices twice and allocated features along the way.
                         const dist = Array.from({ length: n }, () => Array(n).fill(Infinity));
                         for (let i = 0; i < n; i++) {
                             for (let j = i + 1; j < n; j++) {
                                 let minD = Infinity;
-                                // iterate smaller collection against larger to slightly optimize
-                                const a = pointCollections[i];
-                                const b = pointCollections[j];
-                                // For each point in a, find nearest in b
-                                for (let p = 0; p < a.features.length; p++) {
-                                    const pt = a.features[p];
-                                    if (!pt) continue;
-                                    const nearest = turf.nearestPoint(pt, b);
-                                    if (!nearest) continue;
-                                    const d = turf.distance(pt, nearest, { units: 'meters' });
-                                    if (d < minD) minD = d;
-                                }
-                                // Also check the other direction (in case of asymmetry)
-                                for (let p = 0; p < b.features.length; p++) {
-                                    const pt = b.features[p];
-                                    if (!pt) continue;
-                                    const nearest = turf.nearestPoint(pt, a);
-                                    if (!nearest) continue;
-                                    const d = turf.distance(pt, nearest, { units: 'meters' });
-                                    if (d < minD) minD = d;
+                                const a = componentRings[i];
+                                const b = componentRings[j];
+                                for (let p = 0; p < a.length; p++) {
+                                    const pa = [a[p][1], a[p][0]];
+                                    for (let q = 0; q < b.length; q++) {
+                                        const d = calculateDistance(pa, [b[q][1], b[q][0]]) * 1000;
+                                        if (d < minD) minD = d;
+                                    }
                                 }
                                 if (!isFinite(minD)) minD = 0;
                                 dist[i][j] = dist[j][i] = minD;
@@ -594,38 +657,7 @@ export class RoadProcessor {
                 return;
             }
 
-            fetch(overpassEndpoint, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8'
-                },
-                body: 'data=' + encodeURIComponent(minifiedQuery)
-            }).then(response => {
-                if (!response.ok) {
-                    let errorMessage = '';
-                    switch (response.status) {
-                        case 504:
-                            errorMessage = 'Gateway Timeout (504): The server took too long to respond. Please try again.';
-                            break;
-                        case 502:
-                            errorMessage = 'Bad Gateway (502): The server is temporarily unavailable. Please try again later.';
-                            break;
-                        case 503:
-                            errorMessage = 'Service Unavailable (503): The server is temporarily overloaded. Please try again later.';
-                            break;
-                        case 429:
-                            errorMessage = 'Too Many Requests (429): Rate limit exceeded. Please wait a moment before trying again.';
-                            break;
-                        case 400:
-                            errorMessage = 'Bad Request (400): Invalid query parameters. Please try a different search.';
-                            break;
-                        default:
-                            errorMessage = `Server Error (${response.status}): ${response.statusText}. Please try again.`;
-                    }
-                    throw new Error(errorMessage);
-                }
-                return response.json();
-            }).then(async data => {
+            this.fetchOverpassData(overpassEndpoint, minifiedQuery).then(async data => {
                 if (data.remark && data.remark.includes('Query timed out')) {
                     throw new Error('Too many results. Please zoom into a smaller area. (Overpass query timed out after 30 seconds)');
                 }
@@ -725,6 +757,7 @@ export class RoadProcessor {
                 // If route filter is empty, all roads inside boundary are required
                 // If it matches route filter, mark as optional (NOT required)
                 // If it doesn't match route filter, mark as required
+                const matchesRouteFilter = this.compileFilterMatcher(routeFilter);
                 roadFeatures.forEach(feature => {
                     if (feature.properties.isOutsideBoundary) {
                         // Roads outside boundary are always optional
@@ -734,8 +767,7 @@ export class RoadProcessor {
                         feature.properties.isRouteRequired = true;
                     } else {
                         // Check if matches route filter
-                        const matchesRouteFilter = this.checkFeatureMatchesFilter(feature, routeFilter);
-                        feature.properties.isRouteRequired = !matchesRouteFilter;
+                        feature.properties.isRouteRequired = !matchesRouteFilter(feature);
                     }
                 });
                 
@@ -755,21 +787,25 @@ export class RoadProcessor {
                     console.log(`Fetching coverage data from: ${enabledSources.join(', ')}`);
                     
                     try {
-                        // Calculate bounding box for all roads
-                        const allCoords = [];
+                        // Calculate bounding box for all roads in a single pass.
+                        // Spreading every coordinate into Math.min/max would make
+                        // four extra passes and can blow the argument limit on
+                        // large areas.
+                        let minLat = Infinity, maxLat = -Infinity;
+                        let minLng = Infinity, maxLng = -Infinity;
                         roadFeatures.forEach(feature => {
                             if (feature.geometry.type === 'LineString') {
-                                allCoords.push(...feature.geometry.coordinates);
+                                for (const c of feature.geometry.coordinates) {
+                                    if (c[1] < minLat) minLat = c[1];
+                                    if (c[1] > maxLat) maxLat = c[1];
+                                    if (c[0] < minLng) minLng = c[0];
+                                    if (c[0] > maxLng) maxLng = c[0];
+                                }
                             }
                         });
-                        
-                        if (allCoords.length > 0) {
-                            const bbox = {
-                                minLat: Math.min(...allCoords.map(c => c[1])),
-                                maxLat: Math.max(...allCoords.map(c => c[1])),
-                                minLng: Math.min(...allCoords.map(c => c[0])),
-                                maxLng: Math.max(...allCoords.map(c => c[0]))
-                            };
+
+                        if (isFinite(minLat)) {
+                            const bbox = { minLat, maxLat, minLng, maxLng };
                             
                             // Fetch coverage from all enabled sources
                             const coveragePromises = [];
@@ -875,31 +911,31 @@ export class RoadProcessor {
                         clusters.forEach((clusterPoints) => {
                             if (clusterPoints.length <= 1) return;
                             
-                            const clusterKeys = new Set(clusterPoints.map(p => p.properties.key));
+                            // Key -> point lookup; scanning clusterPoints per neighbor
+                            // makes the BFS quadratic in cluster size
+                            const pointsByKey = new Map(clusterPoints.map(p => [p.properties.key, p]));
                             const visited = new Set();
                             const components = [];
-                            
+
                             for (const point of clusterPoints) {
                                 const key = point.properties.key;
                                 if (!visited.has(key)) {
                                     const comp = [];
                                     const queue = [point];
+                                    let queueHead = 0;
                                     visited.add(key);
-                                    
-                                    while (queue.length > 0) {
-                                        const current = queue.shift();
+
+                                    while (queueHead < queue.length) {
+                                        const current = queue[queueHead++];
                                         const currKey = current.properties.key;
                                         comp.push(current);
-                                        
+
                                         const neighbors = adjacencyMap.get(currKey);
                                         if (neighbors) {
                                             for (const neighborKey of neighbors) {
-                                                if (clusterKeys.has(neighborKey) && !visited.has(neighborKey)) {
+                                                if (!visited.has(neighborKey) && pointsByKey.has(neighborKey)) {
                                                     visited.add(neighborKey);
-                                                    const neighborPoint = clusterPoints.find(p => p.properties.key === neighborKey);
-                                                    if (neighborPoint) {
-                                                        queue.push(neighborPoint);
-                                                    }
+                                                    queue.push(pointsByKey.get(neighborKey));
                                                 }
                                             }
                                         }
@@ -1259,19 +1295,19 @@ export class RoadProcessor {
             const routeFilter = document.getElementById('routeFilter').value;
             
             // Initialize coverage properties and route filter marking for uploaded data
+            const matchesRouteFilter = this.compileFilterMatcher(routeFilter);
             roadFeatures.forEach(feature => {
                 feature.properties.coveragePercent = 0;
                 feature.properties.isCovered = false;
                 feature.properties.coverageSources = 'None';
                 feature.properties.isOutsideBoundary = false; // No boundary context for uploaded roads
-                
+
                 if (!routeFilter || routeFilter.trim() === '') {
                     // Empty filter - all roads are required
                     feature.properties.isRouteRequired = true;
                 } else {
                     // Check if matches route filter
-                    const matchesRouteFilter = this.checkFeatureMatchesFilter(feature, routeFilter);
-                    feature.properties.isRouteRequired = !matchesRouteFilter;
+                    feature.properties.isRouteRequired = !matchesRouteFilter(feature);
                 }
             });
             
@@ -1,6 +1,6 @@
 // Routing and animation module
 
-import { calculateDistance, calculateRouteDistanceToIndex, interpolatePoint, stopSpinner } from './utils.js';
+import { calculateDistance, interpolatePoint, stopSpinner } from './utils.js';
 
 const TRAVERSED_ROUTE_STYLE = {
     color: 'cyan',
@@ -20,6 +20,14 @@ export class RoutingManager {
         this.routeIndex = 0;
         this.currentRoutePolyline = null;
         this.currentPositionMarker = null;
+        // Two-point polyline for the partially traversed segment while interpolating
+        this.interpSegmentPolyline = null;
+        // Index of the last route point already added to currentRoutePolyline
+        this.committedIndex = -1;
+        // Cumulative distance (km) from the start to each route point, built
+        // lazily so progress updates and seeks are O(1) instead of re-summing
+        // the whole path
+        this.cumulativeDistances = null;
         
         // Animation state
         this.animationInProgress = false;
@@ -41,6 +49,8 @@ export class RoutingManager {
         this.mediaControls = document.getElementById('mediaControls');
         this.progressBar = document.getElementById('progressBar');
         this.isDragging = false;
+        this.pendingSeekClientX = null;
+        this.seekFrameRequested = false;
         
         this.setupEventListeners();
     }
@@ -116,14 +126,14 @@ export class RoutingManager {
 
         this.progressBar.addEventListener('mousemove', (e) => {
             if (this.isDragging) {
-                this.seekToPosition(e.clientX);
+                this.scheduleSeek(e.clientX);
             }
         });
 
         // Use document-level events to handle dragging outside the progress bar
         document.addEventListener('mousemove', (e) => {
             if (this.isDragging) {
-                this.seekToPosition(e.clientX);
+                this.scheduleSeek(e.clientX);
             }
         });
 
@@ -145,7 +155,7 @@ export class RoutingManager {
         // Use document-level touch events to handle dragging outside the progress bar
         document.addEventListener('touchmove', (e) => {
             if (this.isDragging) {
-                this.seekToPosition(e.touches[0].clientX);
+                this.scheduleSeek(e.touches[0].clientX);
                 e.preventDefault();
             }
         });
@@ -207,8 +217,11 @@ export class RoutingManager {
         this.totalAnimationTime = this.routePoints.length * 30;
         
         // Calculate total route distance
-        this.totalRouteDistance = calculateRouteDistanceToIndex(this.routePoints, this.routePoints.length - 1);
-        
+        this.totalRouteDistance = this.distanceToIndex(this.routePoints.length - 1);
+
+        // Draw the already-traversed part once; frames then only append to it
+        this.syncTraversedPolyline();
+
         // Show media controls
         this.toggleMediaControls(true);
         
@@ -263,10 +276,15 @@ export class RoutingManager {
             this.map.removeLayer(this.currentRoutePolyline);
             this.currentRoutePolyline = null;
         }
+        if (this.interpSegmentPolyline) {
+            this.map.removeLayer(this.interpSegmentPolyline);
+            this.interpSegmentPolyline = null;
+        }
         if (this.currentPositionMarker) {
             this.map.removeLayer(this.currentPositionMarker);
             this.currentPositionMarker = null;
         }
+        this.committedIndex = -1;
         
         // Hide media controls
         this.toggleMediaControls(false);
@@ -316,7 +334,8 @@ export class RoutingManager {
         }
         
         let currentPoint;
-        
+        const segmentStartIndex = this.routeIndex;
+
         if (this.useInterpolation && this.routeIndex < this.routePoints.length - 1) {
             // Use interpolation for smoother movement
             const point1 = this.routePoints[this.routeIndex];
@@ -340,42 +359,26 @@ export class RoutingManager {
             this.routeIndex++;
         }
         
-        // Create interpolated route lines
-        let routeUntilCurrent;
-        
+        // Append any newly reached points to the traversed polyline and draw the
+        // partially traversed segment separately — copying the whole path and
+        // rebuilding the layers every frame is O(points) per frame
+        this.extendTraversedPolyline(segmentStartIndex);
+
         if (this.useInterpolation && this.currentInterpolatedPosition) {
-            // Create interpolated route up to current position
-            routeUntilCurrent = this.routePoints.slice(0, this.routeIndex + 1);
-            if (this.currentInterpolatedPosition) {
-                routeUntilCurrent.push(this.currentInterpolatedPosition);
+            if (!this.interpSegmentPolyline) {
+                this.interpSegmentPolyline = L.polyline([], TRAVERSED_ROUTE_STYLE).addTo(this.map);
             }
-        } else {
-            // Use discrete points (original behavior)
-            routeUntilCurrent = this.routePoints.slice(0, this.routeIndex + 1);
+            this.interpSegmentPolyline.setLatLngs([
+                this.routePoints[Math.min(segmentStartIndex, this.routePoints.length - 1)],
+                currentPoint
+            ]);
+        } else if (this.interpSegmentPolyline) {
+            this.interpSegmentPolyline.setLatLngs([]);
         }
-        
-        // Remove the old traversed route polyline if it exists
-        if (this.currentRoutePolyline) {
-            this.map.removeLayer(this.currentRoutePolyline);
-        }
-        
-        // Create a new traversed route polyline for the current route
-        this.currentRoutePolyline = L.polyline(routeUntilCurrent, TRAVERSED_ROUTE_STYLE).addTo(this.map);
-        
+
         // Add/update current position marker
-        if (this.currentPositionMarker) {
-            this.map.removeLayer(this.currentPositionMarker);
-        }
-        
-        this.currentPositionMarker = L.circleMarker(currentPoint, {
-            radius: 8,
-            fillColor: '#ff6b35',
-            color: '#ffffff',
-            weight: 3,
-            opacity: 1,
-            fillOpacity: 0.8
-        }).addTo(this.map);
-        
+        this.updatePositionMarker(currentPoint);
+
         // Update animation time
         if (!this.useInterpolation) {
             this.currentAnimationTime += 30;
@@ -414,12 +417,32 @@ export class RoutingManager {
         progressFill.style.width = progress + '%';
         
         // Calculate current distance
-        this.currentRouteDistance = calculateRouteDistanceToIndex(this.routePoints, this.routeIndex);
+        this.currentRouteDistance = this.distanceToIndex(this.routeIndex);
         
         // Update distance display
         progressText.textContent = `${this.currentRouteDistance.toFixed(1)} km / ${this.totalRouteDistance.toFixed(1)} km`;
     }
 
+    // Coalesce high-frequency drag events into at most one seek per frame;
+    // each seek rebuilds the traversed polyline, so seeking per mousemove
+    // just burns CPU on redraws the browser never shows
+    scheduleSeek(clientX) {
+        this.pendingSeekClientX = clientX;
+        if (this.seekFrameRequested) {
+            return;
+        }
+
+        this.seekFrameRequested = true;
+        requestAnimationFrame(() => {
+            this.seekFrameRequested = false;
+            if (this.pendingSeekClientX !== null) {
+                const pendingClientX = this.pendingSeekClientX;
+                this.pendingSeekClientX = null;
+                this.seekToPosition(pendingClientX);
+            }
+        });
+    }
+
     seekToPosition(clientX) {
         if (this.routePoints.length === 0) return;
         
@@ -431,39 +454,61 @@ export class RoutingManager {
         if (newIndex >= 0 && newIndex < this.routePoints.length) {
             this.routeIndex = newIndex;
             this.currentAnimationTime = newIndex * 30;
-            this.currentRouteDistance = calculateRouteDistanceToIndex(this.routePoints, this.routeIndex);
+            this.currentRouteDistance = this.distanceToIndex(this.routeIndex);
             this.updateProgress();
             
             // Update the route display
             if (this.routeIndex > 0) {
-                const routeUntilCurrent = this.routePoints.slice(0, this.routeIndex + 1);
-                
-                // Remove existing polylines
-                if (this.currentRoutePolyline) {
-                    this.map.removeLayer(this.currentRoutePolyline);
+                this.syncTraversedPolyline();
+                if (this.interpSegmentPolyline) {
+                    this.interpSegmentPolyline.setLatLngs([]);
                 }
-                
-                // Create new traversed route polyline
-                this.currentRoutePolyline = L.polyline(routeUntilCurrent, TRAVERSED_ROUTE_STYLE).addTo(this.map);
-                
-                // Add/update current position marker
-                if (this.currentPositionMarker) {
-                    this.map.removeLayer(this.currentPositionMarker);
-                }
-                
-                const currentPoint = this.routePoints[this.routeIndex];
-                this.currentPositionMarker = L.circleMarker(currentPoint, {
-                    radius: 8,
-                    fillColor: '#ff6b35',
-                    color: '#ffffff',
-                    weight: 3,
-                    opacity: 1,
-                    fillOpacity: 0.8
-                }).addTo(this.map);
+                this.updatePositionMarker(this.routePoints[this.routeIndex]);
             }
         }
     }
 
+    // Rebuild the traversed polyline to match routePoints[0..routeIndex].
+    // Used when the position jumps (animation start, seeking); during normal
+    // playback extendTraversedPolyline appends incrementally instead.
+    syncTraversedPolyline() {
+        const traversed = this.routePoints.slice(0, this.routeIndex + 1);
+        if (this.currentRoutePolyline) {
+            this.currentRoutePolyline.setLatLngs(traversed);
+        } else {
+            this.currentRoutePolyline = L.polyline(traversed, TRAVERSED_ROUTE_STYLE).addTo(this.map);
+        }
+        this.committedIndex = this.routeIndex;
+    }
+
+    // Append route points up to upToIndex to the traversed polyline without
+    // recreating the layer or copying the already-drawn points
+    extendTraversedPolyline(upToIndex) {
+        if (!this.currentRoutePolyline || upToIndex < this.committedIndex) {
+            this.syncTraversedPolyline();
+            return;
+        }
+        for (let i = this.committedIndex + 1; i <= upToIndex && i < this.routePoints.length; i++) {
+            this.currentRoutePolyline.addLatLng(this.routePoints[i]);
+            this.committedIndex = i;
+        }
+    }
+
+    updatePositionMarker(point) {
+        if (this.currentPositionMarker) {
+            this.currentPositionMarker.setLatLng(point);
+        } else {
+            this.currentPositionMarker = L.circleMarker(point, {
+                radius: 8,
+                fillColor: '#ff6b35',
+                color: '#ffffff',
+                weight: 3,
+                opacity: 1,
+                fillOpacity: 0.8
+            }).addTo(this.map);
+        }
+    }
+
     toggleMediaControls(show) {
         if (show) {
             this.mediaControls.classList.add('visible');
@@ -494,6 +539,22 @@ export class RoutingManager {
     // Setter for route points (called by main app)
     setRoutePoints(points) {
         this.routePoints = points;
+        this.cumulativeDistances = null;
+    }
+
+    // Distance (km) from the route start to the given point index, served
+    // from a prefix-sum array built once per route
+    distanceToIndex(index) {
+        if (this.routePoints.length === 0) return 0;
+        if (!this.cumulativeDistances || this.cumulativeDistances.length !== this.routePoints.length) {
+            const cumulative = new Float64Array(this.routePoints.length);
+            for (let i = 1; i < this.routePoints.length; i++) {
+                cumulative[i] = cumulative[i - 1] + calculateDistance(this.routePoints[i - 1], this.routePoints[i]);
+            }
+            this.cumulativeDistances = cumulative;
+        }
+        const clamped = Math.max(0, Math.min(index, this.cumulativeDistances.length - 1));
+        return this.cumulativeDistances[clamped];
     }
 
     // Getter for route points
@@ -0,0 +1,75 @@
+// Web Worker host for the TeaVM solver
+//
+// The worker is long-lived: teavm.js is loaded and initialized once when the
+// worker starts, then solver jobs are dispatched to it via postMessage. This
+// keeps the solver off the main thread and amortizes the runtime parse cost
+// across all route generations.
+
+importScripts('teavm.js');
+
+function formatConsoleArg(arg) {
+    if (typeof arg === 'string') {
+        return arg;
+    }
+    try {
+        return JSON.stringify(arg);
+    } catch (error) {
+        return String(arg);
+    }
+}
+
+self.onmessage = (event) => {
+    const { jobId, solverId, instanceContent } = event.data || {};
+
+    const outputLines = [];
+    const errorLines = [];
+
+    // The TeaVM runtime writes stdout/stderr through console.* — capture it
+    // the same way the main-thread path does in app.js
+    const captureTo = (lines) => (...args) => {
+        const text = args.map(formatConsoleArg).join(' ');
+        text.split(/\r?\n/).forEach(line => {
+            const trimmed = line.trim();
+            if (trimmed.length > 0) {
+                lines.push(trimmed);
+            }
+        });
+    };
+
+    const originalLog = console.log;
+    const originalInfo = console.info;
+    const originalError = console.error;
+    console.log = captureTo(outputLines);
+    console.info = captureTo(outputLines);
+    console.error = captureTo(errorLines);
+
+    let finished = false;
+    const finish = (success, errorMessage) => {
+        if (finished) {
+            return;
+        }
+        finished = true;
+        console.log = originalLog;
+        console.info = originalInfo;
+        console.error = originalError;
+        self.postMessage({
+            jobId,
+            success,
+            outputLines,
+            errorLines,
+            errorMessage: errorMessage || null
+        });
+    };
+
+    try {
+        self.main([String(solverId), instanceContent], (err) => {
+            if (err) {
+                finish(false, err && err.message ? err.message : String(err));
+            } else {
+                finish(true, null);
+            }
+        });
+    } catch (error) {
+        finish(false, error && error.message ? error.message : String(error));
+    }
+};
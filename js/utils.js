@@ -364,13 +364,14 @@ export function matchesMapilioFilterCriteria(properties, filters) {
 }
 
 /**
- * Stop loading spinner on button
+ * Stop loading spinner on button and re-enable it
  * @param {HTMLElement} button - Button element
  * @param {string} defaultText - Default button text
  */
 export function stopSpinner(button, defaultText) {
     button.classList.remove('button-loading');
     button.innerHTML = defaultText;
+    button.disabled = false;
 }
 
 /**
@@ -479,81 +480,136 @@ export function debounce(func, wait) {
  * @returns {Array} Array of Sets, where each Set contains node IDs in a component
  */
 export function findStronglyConnectedComponents(nodes, edges) {
-    // Build adjacency list (treating undirected edges as bidirectional)
-    const adjacencyList = new Map();
-    
-    // Initialize adjacency list
-    nodes.forEach(node => {
-        adjacencyList.set(node.id, []);
+    // Map node ids to dense integer indices so the whole algorithm can run on
+    // typed arrays instead of Maps keyed by id
+    const idToIndex = new Map();
+    const indexToId = [];
+    const getIndex = (id) => {
+        let idx = idToIndex.get(id);
+        if (idx === undefined) {
+            idx = indexToId.length;
+            idToIndex.set(id, idx);
+            indexToId.push(id);
+        }
+        return idx;
+    };
+
+    nodes.forEach(node => getIndex(node.id));
+
+    // Resolve edge endpoints once and count out-degrees (undirected edges
+    // count in both directions)
+    const edgeSources = new Int32Array(edges.length);
+    const edgeTargets = new Int32Array(edges.length);
+    edges.forEach((edge, e) => {
+        edgeSources[e] = getIndex(edge.source);
+        edgeTargets[e] = getIndex(edge.target);
     });
-    
-    // Add edges to adjacency list
-    edges.forEach(edge => {
-        const source = edge.source;
-        const target = edge.target;
-        
-        if (!adjacencyList.has(source)) adjacencyList.set(source, []);
-        if (!adjacencyList.has(target)) adjacencyList.set(target, []);
-        
+
+    const n = indexToId.length;
+    const outDegree = new Int32Array(n);
+    edges.forEach((edge, e) => {
+        outDegree[edgeSources[e]]++;
         if (edge.directed === false) {
-            // Undirected edge - add both directions
-            adjacencyList.get(source).push(target);
-            adjacencyList.get(target).push(source);
-        } else {
-            // Directed edge - add only forward direction
-            adjacencyList.get(source).push(target);
+            outDegree[edgeTargets[e]]++;
         }
     });
-    
-    // Tarjan's algorithm state
+
+    // CSR-style adjacency: neighbors of v are adjacency[indptr[v]..indptr[v+1])
+    const indptr = new Int32Array(n + 1);
+    for (let v = 0; v < n; v++) {
+        indptr[v + 1] = indptr[v] + outDegree[v];
+    }
+    const adjacency = new Int32Array(indptr[n]);
+    const fillPos = indptr.slice(0, n);
+    edges.forEach((edge, e) => {
+        adjacency[fillPos[edgeSources[e]]++] = edgeTargets[e];
+        if (edge.directed === false) {
+            adjacency[fillPos[edgeTargets[e]]++] = edgeSources[e];
+        }
+    });
+
+    // Tarjan's algorithm state (-1 = not yet visited)
     let index = 0;
-    const indices = new Map();
-    const lowlinks = new Map();
-    const onStack = new Map();
+    const indices = new Int32Array(n).fill(-1);
+    const lowlinks = new Int32Array(n);
+    const onStack = new Uint8Array(n);
     const stack = [];
     const components = [];
-    
-    // Tarjan's DFS
-    function strongConnect(v) {
-        indices.set(v, index);
-        lowlinks.set(v, index);
+
+    // Iterative Tarjan's DFS. The recursive version overflows the call stack
+    // on long road chains (thousands of degree-2 nodes in a row), so the DFS
+    // keeps each frame's node and neighbor cursor on explicit stacks.
+    const frameNode = [];
+    const frameCursor = [];
+
+    function strongConnect(start) {
+        frameNode.push(start);
+        frameCursor.push(indptr[start]);
+
+        indices[start] = index;
+        lowlinks[start] = index;
         index++;
-        stack.push(v);
-        onStack.set(v, true);
-        
-        // Consider successors of v
-        const neighbors = adjacencyList.get(v) || [];
-        for (const w of neighbors) {
-            if (!indices.has(w)) {
-                // Successor w has not yet been visited; recurse on it
-                strongConnect(w);
-                lowlinks.set(v, Math.min(lowlinks.get(v), lowlinks.get(w)));
-            } else if (onStack.get(w)) {
-                // Successor w is in stack and hence in the current SCC
-                lowlinks.set(v, Math.min(lowlinks.get(v), indices.get(w)));
+        stack.push(start);
+        onStack[start] = 1;
+
+        while (frameNode.length > 0) {
+            const top = frameNode.length - 1;
+            const v = frameNode[top];
+            const end = indptr[v + 1];
+            let recursed = false;
+
+            while (frameCursor[top] < end) {
+                const w = adjacency[frameCursor[top]++];
+
+                if (indices[w] === -1) {
+                    // Successor w has not yet been visited; descend into it
+                    indices[w] = index;
+                    lowlinks[w] = index;
+                    index++;
+                    stack.push(w);
+                    onStack[w] = 1;
+                    frameNode.push(w);
+                    frameCursor.push(indptr[w]);
+                    recursed = true;
+                    break;
+                } else if (onStack[w]) {
+                    // Successor w is in stack and hence in the current SCC
+                    if (indices[w] < lowlinks[v]) lowlinks[v] = indices[w];
+                }
+            }
+
+            if (recursed) continue;
+
+            // All successors of v are done; close its frame
+            frameNode.pop();
+            frameCursor.pop();
+
+            if (frameNode.length > 0) {
+                const parent = frameNode[frameNode.length - 1];
+                if (lowlinks[v] < lowlinks[parent]) lowlinks[parent] = lowlinks[v];
+            }
+
+            // If v is a root node, pop the stack and create an SCC
+            if (lowlinks[v] === indices[v]) {
+                const component = new Set();
+                let w;
+                do {
+                    w = stack.pop();
+                    onStack[w] = 0;
+                    component.add(indexToId[w]);
+                } while (w !== v);
+                components.push(component);
             }
-        }
-        
-        // If v is a root node, pop the stack and create an SCC
-        if (lowlinks.get(v) === indices.get(v)) {
-            const component = new Set();
-            let w;
-            do {
-                w = stack.pop();
-                onStack.set(w, false);
-                component.add(w);
-            } while (w !== v);
-            components.push(component);
         }
     }
-    
+
     // Run Tarjan's algorithm on all nodes
     for (const node of nodes) {
-        if (!indices.has(node.id)) {
-            strongConnect(node.id);
+        if (indices[idToIndex.get(node.id)] === -1) {
+            strongConnect(idToIndex.get(node.id));
         }
     }
-    
+
     return components;
 }
 